@@ -9,6 +9,25 @@ import os
 
 required_conan_version = ">=1.53.0"
 
+# Options forwarded as-is to the OIIO USE_* CMake switches
+_OPTIONS_CMAKE_MAP = (
+    ("with_hdf5", "USE_HDF5"),
+    ("with_opencolorio", "USE_OPENCOLORIO"),
+    ("with_opencv", "USE_OPENCV"),
+    ("with_tbb", "USE_TBB"),
+    ("with_dicom", "USE_DCMTK"),
+    ("with_ffmpeg", "USE_FFMPEG"),
+    ("with_giflib", "USE_GIF"),
+    ("with_libheif", "USE_LIBHEIF"),
+    ("with_raw", "USE_LIBRAW"),
+    ("with_openvdb", "USE_OPENVDB"),
+    ("with_ptex", "USE_PTEX"),
+    ("with_libpng", "USE_LIBPNG"),
+    ("with_freetype", "USE_FREETYPE"),
+    ("with_libwebp", "USE_LIBWEBP"),
+    ("with_openjpeg", "USE_OPENJPEG"),
+)
+
 
 class OpenImageIOConan(ConanFile):
     name = "openimageio"
@@ -68,6 +87,57 @@ class OpenImageIOConan(ConanFile):
     short_paths = True
     generators = "cmake", "cmake_find_package"
 
+    # Conan component key of each OpenImageIO CMake target
+    _COMPONENT_KEY = {
+        "OpenImageIO_Util": "openimageio_util",
+        "OpenImageIO": "main",
+    }
+    _UTIL_REQUIRES = (
+        "boost::filesystem",
+        "boost::thread",
+        "boost::system",
+        "boost::regex",
+        "openexr::openexr",
+    )
+    _MAIN_REQUIRES = (
+        _COMPONENT_KEY["OpenImageIO_Util"],
+        "zlib::zlib",
+        "boost::thread",
+        "boost::system",
+        "boost::container",
+        "boost::regex",
+        "libtiff::libtiff",
+        "openexr::openexr",
+        "pugixml::pugixml",
+        "tsl-robin-map::tsl-robin-map",
+        "libsquish::libsquish",
+        "fmt::fmt",
+    )
+    _LIBJPEG_REQUIRES = {
+        "libjpeg": "libjpeg::libjpeg",
+        "libjpeg-turbo": "libjpeg-turbo::libjpeg-turbo",
+    }
+    # Optional dependencies linked by the OpenImageIO component
+    _OPTIONAL_REQUIRES = (
+        ("with_libpng", "libpng::libpng"),
+        ("with_freetype", "freetype::freetype"),
+        ("with_hdf5", "hdf5::hdf5"),
+        ("with_opencolorio", "opencolorio::opencolorio"),
+        ("with_opencv", "opencv::opencv"),
+        ("with_dicom", "dcmtk::dcmtk"),
+        ("with_ffmpeg", "ffmpeg::ffmpeg"),
+        ("with_giflib", "giflib::giflib"),
+        ("with_libheif", "libheif::libheif"),
+        ("with_raw", "libraw::libraw"),
+        ("with_openjpeg", "openjpeg::openjpeg"),
+        ("with_openvdb", "openvdb::openvdb"),
+        ("with_ptex", "ptex::ptex"),
+        ("with_libwebp", "libwebp::libwebp"),
+    )
+
+    _MIN_VERSION_CPP14 = Version("2.3.0.0")
+    _MIN_VERSION_OPENCOLORIO_2 = Version("2.3.7.2")
+
     @property
     def _source_subfolder(self):
         return "source_subfolder"
@@ -90,14 +160,17 @@ class OpenImageIOConan(ConanFile):
             del self.options.fPIC
 
     def requirements(self):
+        opts = self.options
+        with_libjpeg = str(opts.with_libjpeg)
+
         # Required libraries
         self.requires("zlib/1.2.13")
         self.requires("boost/1.78.0")
         self.requires("libtiff/4.5.1")
         self.requires("openexr/2.5.7")
-        if self.options.with_libjpeg == "libjpeg":
+        if with_libjpeg == "libjpeg":
             self.requires("libjpeg/9e")
-        elif self.options.with_libjpeg == "libjpeg-turbo":
+        elif with_libjpeg == "libjpeg-turbo":
             self.requires("libjpeg-turbo/2.1.5")
         self.requires("pugixml/1.12.1")
         self.requires("libsquish/1.15")
@@ -105,50 +178,51 @@ class OpenImageIOConan(ConanFile):
         self.requires("fmt/8.1.1")
 
         # Optional libraries
-        if self.options.with_libpng:
+        if opts.with_libpng:
             self.requires("libpng/1.6.40")
-        if self.options.with_freetype:
+        if opts.with_freetype:
             self.requires("freetype/2.13.0")
-        if self.options.with_hdf5:
+        if opts.with_hdf5:
             self.requires("hdf5/1.12.1")
-        if self.options.with_opencolorio:
-            if Version(self.version) < "2.3.7.2":
+        if opts.with_opencolorio:
+            if Version(self.version) < self._MIN_VERSION_OPENCOLORIO_2:
                 self.requires("opencolorio/1.1.1")
             else:
                 self.requires("opencolorio/2.1.0")
-        if self.options.with_opencv:
+        if opts.with_opencv:
             self.requires("opencv/4.5.5")
-        if self.options.with_tbb:
+        if opts.with_tbb:
             self.requires("onetbb/2020.3")
-        if self.options.with_dicom:
+        if opts.with_dicom:
             self.requires("dcmtk/3.6.6")
-        if self.options.with_ffmpeg:
+        if opts.with_ffmpeg:
             self.requires("ffmpeg/4.4")
         # TODO: Field3D dependency
-        if self.options.with_giflib:
+        if opts.with_giflib:
             self.requires("giflib/5.2.1")
-        if self.options.with_libheif:
+        if opts.with_libheif:
             self.requires("libheif/1.12.0")
-        if self.options.with_raw:
+        if opts.with_raw:
             self.requires("libraw/0.20.2")
-        if self.options.with_openjpeg:
+        if opts.with_openjpeg:
             self.requires("openjpeg/2.5.0")
-        if self.options.with_openvdb:
+        if opts.with_openvdb:
             self.requires("openvdb/8.0.1")
-        if self.options.with_ptex:
+        if opts.with_ptex:
             self.requires("ptex/2.4.0")
-        if self.options.with_libwebp:
+        if opts.with_libwebp:
             self.requires("libwebp/1.3.1")
         # TODO: R3DSDK dependency
         # TODO: Nuke dependency
 
     def validate(self):
+        opts = self.options
         if self.settings.compiler.get_safe("cppstd"):
-            if Version(self.version) >= "2.3.0.0" or self.options.with_openvdb:
+            if Version(self.version) >= self._MIN_VERSION_CPP14 or opts.with_openvdb:
                 check_min_cppstd(self, 14)
             else:
                 check_min_cppstd(self, 11)
-        if is_msvc(self) and is_msvc_static_runtime(self) and self.options.shared:
+        if opts.shared and is_msvc(self) and is_msvc_static_runtime(self):
             raise ConanInvalidConfiguration(
                 "Building shared library with static runtime is not supported!"
             )
@@ -167,48 +241,35 @@ class OpenImageIOConan(ConanFile):
     @functools.lru_cache(1)
     def _configure_cmake(self):
         cmake = CMake(self)
+        opts = self.options
 
-        # CMake options
-        cmake.definitions["CMAKE_DEBUG_POSTFIX"] = ""  # Needed for 2.3.x.x+ versions
-        cmake.definitions["OIIO_BUILD_TOOLS"] = True
-        cmake.definitions["OIIO_BUILD_TESTS"] = False
-        cmake.definitions["BUILD_DOCS"] = False
-        cmake.definitions["INSTALL_DOCS"] = False
-        cmake.definitions["INSTALL_FONTS"] = False
-        cmake.definitions["INSTALL_CMAKE_HELPER"] = False
-        cmake.definitions["EMBEDPLUGINS"] = True
-        cmake.definitions["USE_PYTHON"] = False
-        cmake.definitions["USE_EXTERNAL_PUGIXML"] = True
+        cmake.definitions.update({
+            # CMake options
+            "CMAKE_DEBUG_POSTFIX": "",  # Needed for 2.3.x.x+ versions
+            "OIIO_BUILD_TOOLS": True,
+            "OIIO_BUILD_TESTS": False,
+            "BUILD_DOCS": False,
+            "INSTALL_DOCS": False,
+            "INSTALL_FONTS": False,
+            "INSTALL_CMAKE_HELPER": False,
+            "EMBEDPLUGINS": True,
+            "USE_PYTHON": False,
+            "USE_EXTERNAL_PUGIXML": True,
+            "USE_JPEG": True,  # Needed for jpeg.imageio plugin, libjpeg/libjpeg-turbo selection still works
+            "USE_FIELD3D": False,
+            "USE_R3DSDK": False,
+            "USE_NUKE": False,
+            "USE_OPENGL": False,
+            "USE_QT": False,
+        })
 
         # OIIO CMake files are patched to check USE_* flags to require or not use dependencies
-        cmake.definitions["USE_JPEGTURBO"] = (
-            self.options.with_libjpeg == "libjpeg-turbo"
+        cmake.definitions["USE_JPEGTURBO"] = opts.with_libjpeg == "libjpeg-turbo"
+        cmake.definitions.update(
+            {definition: getattr(opts, option) for option, definition in _OPTIONS_CMAKE_MAP}
         )
-        cmake.definitions[
-            "USE_JPEG"
-        ] = True  # Needed for jpeg.imageio plugin, libjpeg/libjpeg-turbo selection still works
-        cmake.definitions["USE_HDF5"] = self.options.with_hdf5
-        cmake.definitions["USE_OPENCOLORIO"] = self.options.with_opencolorio
-        cmake.definitions["USE_OPENCV"] = self.options.with_opencv
-        cmake.definitions["USE_TBB"] = self.options.with_tbb
-        cmake.definitions["USE_DCMTK"] = self.options.with_dicom
-        cmake.definitions["USE_FFMPEG"] = self.options.with_ffmpeg
-        cmake.definitions["USE_FIELD3D"] = False
-        cmake.definitions["USE_GIF"] = self.options.with_giflib
-        cmake.definitions["USE_LIBHEIF"] = self.options.with_libheif
-        cmake.definitions["USE_LIBRAW"] = self.options.with_raw
-        cmake.definitions["USE_OPENVDB"] = self.options.with_openvdb
-        cmake.definitions["USE_PTEX"] = self.options.with_ptex
-        cmake.definitions["USE_R3DSDK"] = False
-        cmake.definitions["USE_NUKE"] = False
-        cmake.definitions["USE_OPENGL"] = False
-        cmake.definitions["USE_QT"] = False
-        cmake.definitions["USE_LIBPNG"] = self.options.with_libpng
-        cmake.definitions["USE_FREETYPE"] = self.options.with_freetype
-        cmake.definitions["USE_LIBWEBP"] = self.options.with_libwebp
-        cmake.definitions["USE_OPENJPEG"] = self.options.with_openjpeg
-
-        if self.options.with_openvdb:
+
+        if opts.with_openvdb:
             cmake.definitions["CMAKE_CXX_STANDARD"] = 14
 
         cmake.configure(build_folder=self._build_subfolder)
@@ -224,99 +285,53 @@ class OpenImageIOConan(ConanFile):
         cmake = self._configure_cmake()
         cmake.install()
 
-        files.rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
-        files.rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        lib_folder = os.path.join(self.package_folder, "lib")
+        files.rmdir(self, os.path.join(lib_folder, "cmake"))
+        files.rmdir(self, os.path.join(lib_folder, "pkgconfig"))
         files.rmdir(self, os.path.join(self.package_folder, "share"))
 
         self.copy("LICENSE.md", src=self._source_subfolder, dst="licenses")
 
     def package_info(self):
+        opts = self.options
+        with_libjpeg = str(opts.with_libjpeg)
+        is_unix = self.settings.os in ["Linux", "FreeBSD"]
+
         self.cpp_info.set_property("cmake_file_name", "OpenImageIO")
         self.cpp_info.set_property("cmake_target_name", "OpenImageIO::OpenImageIO")
         self.cpp_info.set_property("pkg_config_name", "OpenImageIO")
 
-        self.cpp_info.components["openimageio_util"].set_property(
-            "cmake_target_name", "OpenImageIO::OpenImageIO_Util"
-        )
-        self.cpp_info.components["openimageio_util"].libs = ["OpenImageIO_Util"]
-        self.cpp_info.components["openimageio_util"].requires = [
-            "boost::filesystem",
-            "boost::thread",
-            "boost::system",
-            "boost::regex",
-            "openexr::openexr",
-        ]
-        if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.components["openimageio_util"].system_libs.extend(
-                ["dl", "m", "pthread"]
-            )
+        open_image_io_util = self.cpp_info.components[self._COMPONENT_KEY["OpenImageIO_Util"]]
+        open_image_io_util.set_property("cmake_target_name", "OpenImageIO::OpenImageIO_Util")
+        open_image_io_util.libs = ["OpenImageIO_Util"]
+        open_image_io_util.requires = list(self._UTIL_REQUIRES)
+        if opts.with_tbb:
+            open_image_io_util.requires.append("onetbb::onetbb")
+        if is_unix:
+            open_image_io_util.system_libs.extend(["dl", "m", "pthread"])
 
-        self.cpp_info.components["main"].set_property(
-            "cmake_target_name", "OpenImageIO::OpenImageIO"
-        )
-        self.cpp_info.components["main"].set_property("pkg_config_name", "OpenImageIO")
-        self.cpp_info.components["main"].libs = ["OpenImageIO"]
-        self.cpp_info.components["main"].requires = [
-            "openimageio_util",
-            "zlib::zlib",
-            "boost::thread",
-            "boost::system",
-            "boost::container",
-            "boost::regex",
-            "libtiff::libtiff",
-            "openexr::openexr",
-            "pugixml::pugixml",
-            "tsl-robin-map::tsl-robin-map",
-            "libsquish::libsquish",
-            "fmt::fmt",
+        open_image_io = self.cpp_info.components[self._COMPONENT_KEY["OpenImageIO"]]
+        open_image_io.set_property("cmake_target_name", "OpenImageIO::OpenImageIO")
+        open_image_io.set_property("pkg_config_name", "OpenImageIO")
+        open_image_io.libs = ["OpenImageIO"]
+        open_image_io.requires = [
+            *self._MAIN_REQUIRES,
+            self._LIBJPEG_REQUIRES[with_libjpeg],
         ]
-        if self.options.with_libjpeg == "libjpeg":
-            self.cpp_info.components["main"].requires.append("libjpeg::libjpeg")
-        elif self.options.with_libjpeg == "libjpeg-turbo":
-            self.cpp_info.components["main"].requires.append(
-                "libjpeg-turbo::libjpeg-turbo"
-            )
-        if self.options.with_libpng:
-            self.cpp_info.components["main"].requires.append("libpng::libpng")
-        if self.options.with_freetype:
-            self.cpp_info.components["main"].requires.append("freetype::freetype")
-        if self.options.with_hdf5:
-            self.cpp_info.components["main"].requires.append("hdf5::hdf5")
-        if self.options.with_opencolorio:
-            self.cpp_info.components["main"].requires.append("opencolorio::opencolorio")
-        if self.options.with_opencv:
-            self.cpp_info.components["main"].requires.append("opencv::opencv")
-        if self.options.with_tbb:
-            self.cpp_info.components["openimageio_util"].requires.append("onetbb::onetbb")
-        if self.options.with_dicom:
-            self.cpp_info.components["main"].requires.append("dcmtk::dcmtk")
-        if self.options.with_ffmpeg:
-            self.cpp_info.components["main"].requires.append("ffmpeg::ffmpeg")
-        if self.options.with_giflib:
-            self.cpp_info.components["main"].requires.append("giflib::giflib")
-        if self.options.with_libheif:
-            self.cpp_info.components["main"].requires.append("libheif::libheif")
-        if self.options.with_raw:
-            self.cpp_info.components["main"].requires.append("libraw::libraw")
-        if self.options.with_openjpeg:
-            self.cpp_info.components["main"].requires.append("openjpeg::openjpeg")
-        if self.options.with_openvdb:
-            self.cpp_info.components["main"].requires.append("openvdb::openvdb")
-        if self.options.with_ptex:
-            self.cpp_info.components["main"].requires.append("ptex::ptex")
-        if self.options.with_libwebp:
-            self.cpp_info.components["main"].requires.append("libwebp::libwebp")
-        if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.components["main"].system_libs.extend(["dl", "m", "pthread"])
-
-        if not self.options.shared:
-            self.cpp_info.components["main"].defines.append("OIIO_STATIC_DEFINE")
+        open_image_io.requires += [
+            require
+            for option, require in self._OPTIONAL_REQUIRES
+            if getattr(opts, option)
+        ]
+        if is_unix:
+            open_image_io.system_libs.extend(["dl", "m", "pthread"])
+
+        if not opts.shared:
+            open_image_io.defines.append("OIIO_STATIC_DEFINE")
 
         # TODO: to remove in conan v2 once cmake_find_package* & pkg_config generators removed
         self.cpp_info.names["cmake_find_package"] = "OpenImageIO"
         self.cpp_info.names["cmake_find_package_multi"] = "OpenImageIO"
         self.cpp_info.names["pkg_config"] = "OpenImageIO"
-        self.cpp_info.components["openimageio_util"].names[
-            "cmake_find_package"
-        ] = "OpenImageIO_Util"
-        self.cpp_info.components["main"].names["cmake_find_package"] = "OpenImageIO"
+        open_image_io_util.names["cmake_find_package"] = "OpenImageIO_Util"
+        open_image_io.names["cmake_find_package"] = "OpenImageIO"